@@ -4,6 +4,7 @@ Main CLI entry point for iONspID.
 This module provides the command-line interface for the iONspID application.
 """
 
+import logging
 import sys
 from pathlib import Path
 from typing import List, Optional
@@ -11,12 +12,64 @@ from typing import List, Optional
 import click
 
 from ionspid import __version__
-from ionspid.utils.logging import get_logger, configure_logging
-from ionspid.config.settings import SettingsManager
+from ionspid.utils.logging import get_console, get_logger, configure_logging
+from ionspid.config.settings import get_settings_manager
 from ionspid.utils.exceptions import iONspIDError, CLIError, InputError, ProcessingError, ConfigError
 
 logger = get_logger(__name__)
 
+# Usage examples shown at the end of help-all, rendered with one write each
+_RICH_EXAMPLES = (
+    "[bold]Common Usage Examples:[/bold]\n\n"
+    "[cyan]# Inspect any sequencing data file[/cyan]\n"
+    "ionspid data inspect data/sequences.fastq\n"
+    "ionspid data inspect data/nanopore.pod5\n\n"
+    "[cyan]# Get statistics for sequencing data[/cyan]\n"
+    "ionspid data stats data/sequences.fasta --plot\n\n"
+    "[cyan]# Check basecalling setup[/cyan]\n"
+    "ionspid basecall check\n\n"
+    "[cyan]# Run quality control on sequencing data[/cyan]\n"
+    "ionspid qc run --summary data/summary.txt\n\n"
+    "[cyan]# Filter sequences by quality[/cyan]\n"
+    "ionspid filter run --input data.fastq --output filtered.fastq\n\n"
+    "[cyan]# Run BLAST search[/cyan]\n"
+    "ionspid blast search --input sequences.fasta --db nt --output results.txt\n\n"
+    "[cyan]# Get detailed help for specific command[/cyan]\n"
+    "ionspid <command> --help\n"
+    "ionspid <command> <subcommand> --help"
+)
+
+_SIMPLE_EXAMPLES = "\n".join([
+    "\n" + "=" * 70,
+    "COMMON USAGE EXAMPLES:",
+    "=" * 70,
+    "",
+    "# Inspect any sequencing data file",
+    "ionspid data inspect data/sequences.fastq",
+    "ionspid data inspect data/nanopore.pod5",
+    "",
+    "# Get statistics for sequencing data",
+    "ionspid data stats data/sequences.fasta --plot",
+    "",
+    "# Check basecalling setup",
+    "ionspid basecall check",
+    "",
+    "# Run quality control on sequencing data",
+    "ionspid qc run --summary data/summary.txt",
+    "",
+    "# Filter sequences by quality",
+    "ionspid filter run --input data.fastq --output filtered.fastq",
+    "",
+    "# Run BLAST search",
+    "ionspid blast search --input sequences.fasta --db nt --output results.txt",
+    "",
+    "# Get detailed help for specific command",
+    "ionspid <command> --help",
+    "ionspid <command> <subcommand> --help",
+    "",
+    "For detailed help on any command, use: ionspid <command> --help",
+])
+
 
 @click.command(name="help-all")
 @click.option(
@@ -33,23 +86,50 @@ def help_all(ctx: click.Context, rich: bool):
     This command provides a complete overview of the iONspID CLI interface,
     showing all command groups, their subcommands, and available options.
     """
-    # Get the main CLI group
-    main_cli = ctx.find_root().command
+    help_data = _collect_help_data(ctx.find_root().command)
     
     if rich:
-        _display_help_rich(main_cli)
+        _display_help_rich(help_data)
     else:
-        _display_help_simple(main_cli)
+        _display_help_simple(help_data)
+
+
+def _collect_help_data(main_cli: click.Group) -> dict:
+    """
+    Collect help information by walking the Click command tree.
+    
+    Args:
+        main_cli: Root Click group
+        
+    Returns:
+        Dictionary with global options and per-command help and subcommands
+    """
+    params = [
+        {"opts": list(param.opts), "help": getattr(param, "help", None)}
+        for param in main_cli.params
+        if hasattr(param, 'opts')
+    ]
+    
+    commands = {}
+    for cmd_name, cmd in main_cli.commands.items():
+        subcommands = None
+        if isinstance(cmd, click.Group) and cmd.commands:
+            subcommands = {
+                subcmd_name: subcmd.help
+                for subcmd_name, subcmd in cmd.commands.items()
+            }
+        commands[cmd_name] = {"help": cmd.help, "subcommands": subcommands}
+    
+    return {"params": params, "commands": commands}
 
 
-def _display_help_rich(main_cli):
+def _display_help_rich(help_data: dict):
     """Display help using Rich formatting."""
     try:
-        from rich.console import Console
         from rich.panel import Panel
         from rich.table import Table
         
-        console = Console()
+        console = get_console()
         
         console.print(Panel.fit(
             "[bold cyan]iONspID: MinION NGS Species Identification Pipeline[/bold cyan]\n"
@@ -59,18 +139,17 @@ def _display_help_rich(main_cli):
         
         # Display main CLI options
         console.print("\n[bold]Global Options:[/bold]")
-        if main_cli.params:
-            for param in main_cli.params:
-                if hasattr(param, 'opts'):
-                    opts_str = ', '.join(param.opts)
-                    help_text = param.help or "No description available"
-                    console.print(f"  [cyan]{opts_str}[/cyan]: {help_text}")
+        for param in help_data["params"]:
+            opts_str = ', '.join(param["opts"])
+            help_text = param["help"] or "No description available"
+            console.print(f"  [cyan]{opts_str}[/cyan]: {help_text}")
         
         # Display all command groups
         console.print("\n[bold]Available Command Groups:[/bold]")
         
-        for cmd_name in sorted(main_cli.commands.keys()):
-            cmd = main_cli.commands[cmd_name]
+        commands = help_data["commands"]
+        for cmd_name in sorted(commands.keys()):
+            cmd = commands[cmd_name]
             
             # Skip help-all command in listing
             if cmd_name == "help-all":
@@ -78,11 +157,12 @@ def _display_help_rich(main_cli):
                 
             console.print(f"\n[bold green]ionspid {cmd_name}[/bold green]")
             
-            if cmd.help:
-                console.print(f"  [dim]{cmd.help}[/dim]")
+            if cmd["help"]:
+                console.print(f"  [dim]{cmd['help']}[/dim]")
             
             # If it's a group, show subcommands
-            if hasattr(cmd, 'commands') and cmd.commands:
+            subcommands = cmd["subcommands"]
+            if subcommands:
                 console.print("  [bold]Subcommands:[/bold]")
                 
                 # Create table for subcommands
@@ -90,9 +170,8 @@ def _display_help_rich(main_cli):
                 table.add_column("Command", style="cyan")
                 table.add_column("Description", style="dim")
                 
-                for subcmd_name in sorted(cmd.commands.keys()):
-                    subcmd = cmd.commands[subcmd_name]
-                    help_text = subcmd.help or "No description available"
+                for subcmd_name in sorted(subcommands.keys()):
+                    help_text = subcommands[subcmd_name] or "No description available"
                     # Truncate long help text
                     if len(help_text) > 80:
                         help_text = help_text[:77] + "..."
@@ -105,23 +184,7 @@ def _display_help_rich(main_cli):
         
         # Display usage examples
         console.print(Panel(
-            "[bold]Common Usage Examples:[/bold]\n\n"
-            "[cyan]# Inspect any sequencing data file[/cyan]\n"
-            "ionspid data inspect data/sequences.fastq\n"
-            "ionspid data inspect data/nanopore.pod5\n\n"
-            "[cyan]# Get statistics for sequencing data[/cyan]\n"
-            "ionspid data stats data/sequences.fasta --plot\n\n"
-            "[cyan]# Check basecalling setup[/cyan]\n"
-            "ionspid basecall check\n\n"
-            "[cyan]# Run quality control on sequencing data[/cyan]\n"
-            "ionspid qc run --summary data/summary.txt\n\n"
-            "[cyan]# Filter sequences by quality[/cyan]\n"
-            "ionspid filter run --input data.fastq --output filtered.fastq\n\n"
-            "[cyan]# Run BLAST search[/cyan]\n"
-            "ionspid blast search --input sequences.fasta --db nt --output results.txt\n\n"
-            "[cyan]# Get detailed help for specific command[/cyan]\n"
-            "ionspid <command> --help\n"
-            "ionspid <command> <subcommand> --help",
+            _RICH_EXAMPLES,
             title="Examples",
             border_style="green"
         ))
@@ -130,10 +193,10 @@ def _display_help_rich(main_cli):
         
     except ImportError:
         click.echo("Rich package not available. Use --no-rich flag for simple formatting.")
-        _display_help_simple(main_cli)
+        _display_help_simple(help_data)
 
 
-def _display_help_simple(main_cli):
+def _display_help_simple(help_data: dict):
     """Display help using simple text formatting."""
     click.echo("=" * 70)
     click.echo("iONspID: MinION NGS Species Identification Pipeline")
@@ -142,19 +205,18 @@ def _display_help_simple(main_cli):
     
     # Display main CLI options
     click.echo("\nGLOBAL OPTIONS:")
-    if main_cli.params:
-        for param in main_cli.params:
-            if hasattr(param, 'opts'):
-                opts_str = ', '.join(param.opts)
-                help_text = param.help or "No description available"
-                click.echo(f"  {opts_str:<20} {help_text}")
+    for param in help_data["params"]:
+        opts_str = ', '.join(param["opts"])
+        help_text = param["help"] or "No description available"
+        click.echo(f"  {opts_str:<20} {help_text}")
     
     # Display all command groups
     click.echo("\nAVAILABLE COMMAND GROUPS:")
     click.echo("-" * 40)
     
-    for cmd_name in sorted(main_cli.commands.keys()):
-        cmd = main_cli.commands[cmd_name]
+    commands = help_data["commands"]
+    for cmd_name in sorted(commands.keys()):
+        cmd = commands[cmd_name]
         
         # Skip help-all command in listing
         if cmd_name == "help-all":
@@ -162,16 +224,16 @@ def _display_help_simple(main_cli):
             
         click.echo(f"\nionspid {cmd_name}")
         
-        if cmd.help:
-            click.echo(f"  Description: {cmd.help}")
+        if cmd["help"]:
+            click.echo(f"  Description: {cmd['help']}")
         
         # If it's a group, show subcommands
-        if hasattr(cmd, 'commands') and cmd.commands:
+        subcommands = cmd["subcommands"]
+        if subcommands:
             click.echo("  Subcommands:")
             
-            for subcmd_name in sorted(cmd.commands.keys()):
-                subcmd = cmd.commands[subcmd_name]
-                help_text = subcmd.help or "No description available"
+            for subcmd_name in sorted(subcommands.keys()):
+                help_text = subcommands[subcmd_name] or "No description available"
                 # Truncate long help text
                 if len(help_text) > 60:
                     help_text = help_text[:57] + "..."
@@ -181,34 +243,7 @@ def _display_help_simple(main_cli):
             click.echo("  Single command (no subcommands)")
     
     # Display usage examples
-    click.echo("\n" + "=" * 70)
-    click.echo("COMMON USAGE EXAMPLES:")
-    click.echo("=" * 70)
-    click.echo()
-    click.echo("# Inspect any sequencing data file")
-    click.echo("ionspid data inspect data/sequences.fastq")
-    click.echo("ionspid data inspect data/nanopore.pod5")
-    click.echo()
-    click.echo("# Get statistics for sequencing data")
-    click.echo("ionspid data stats data/sequences.fasta --plot")
-    click.echo()
-    click.echo("# Check basecalling setup")
-    click.echo("ionspid basecall check")
-    click.echo()
-    click.echo("# Run quality control on sequencing data")
-    click.echo("ionspid qc run --summary data/summary.txt")
-    click.echo()
-    click.echo("# Filter sequences by quality")
-    click.echo("ionspid filter run --input data.fastq --output filtered.fastq")
-    click.echo()
-    click.echo("# Run BLAST search")
-    click.echo("ionspid blast search --input sequences.fasta --db nt --output results.txt")
-    click.echo()
-    click.echo("# Get detailed help for specific command")
-    click.echo("ionspid <command> --help")
-    click.echo("ionspid <command> <subcommand> --help")
-    click.echo()
-    click.echo("For detailed help on any command, use: ionspid <command> --help")
+    click.echo(_SIMPLE_EXAMPLES)
 
 
 @click.group(context_settings={"help_option_names": ["-h", "--help"]})
@@ -265,7 +300,7 @@ def cli(
     )
     
     # Load settings
-    settings_manager = SettingsManager()
+    settings_manager = get_settings_manager()
     if config:
         settings_manager.load_settings(config)
     
@@ -308,24 +343,19 @@ def handle_cli_exception(exc, logger=None, debug=False):
         logger: Logger to use for error logging
         debug: If True, show full traceback
     """
-    try:
-        from rich.console import Console
-        from rich.traceback import Traceback
-        console = Console()
-        use_rich = True
-    except ImportError:
-        console = None
-        use_rich = False
+    console = get_console()
     
-    if logger:
-        logger.error(str(exc), exc_info=True)
+    # Only format the traceback for the log when it was actually requested
+    if logger and logger.isEnabledFor(logging.ERROR):
+        logger.error("%s", exc, exc_info=debug)
     
-    if use_rich:
+    if console is not None:
         if isinstance(exc, iONspIDError):
             console.print(f"[bold red][ERROR][/bold red] {str(exc)}")
         else:
             console.print(f"[bold red][UNEXPECTED ERROR][/bold red] {str(exc)}")
         if debug:
+            from rich.traceback import Traceback
             tb = Traceback.from_exception(type(exc), exc, exc.__traceback__)
             console.print(tb)
         else:
@@ -351,17 +381,16 @@ def summarize_errors(error_list):
     if not error_list:
         return
     
-    try:
-        from rich.console import Console
-        console = Console()
-        console.print(f"[bold red]Batch completed with {len(error_list)} errors:[/bold red]")
-        for i, err in enumerate(error_list, 1):
-            console.print(f"  {i}. {type(err).__name__}: {err}")
-    except ImportError:
+    header = f"Batch completed with {len(error_list)} errors:"
+    lines = [f"  {i}. {type(err).__name__}: {err}" for i, err in enumerate(error_list, 1)]
+    
+    # Emit the whole summary with a single write
+    console = get_console()
+    if console is not None:
+        console.print("\n".join([f"[bold red]{header}[/bold red]", *lines]))
+    else:
         # Fallback to plain text
-        click.echo(f"✗ Batch completed with {len(error_list)} errors:", err=True)
-        for i, err in enumerate(error_list, 1):
-            click.echo(f"  {i}. {type(err).__name__}: {err}", err=True)
+        click.echo("\n".join([f"✗ {header}", *lines]), err=True)
 
 
 def main(args: Optional[List[str]] = None) -> int:
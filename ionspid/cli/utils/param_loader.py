@@ -4,18 +4,50 @@ Parameter loading and validation utilities for CLI.
 This module provides functions to load, merge, and validate parameters from CLI, environment, and config files using pydantic models.
 """
 
+import copy
+import functools
 import os
 import json
 import yaml
 from pathlib import Path
-from typing import Any, Dict, Type, Optional, Union
+from typing import Any, Dict, IO, Tuple, Type, Optional, Union
 from pydantic import BaseModel, ValidationError
 
 from ionspid.utils.exceptions import CLIError, ConfigError, InputError
 from ionspid.utils.logging import get_logger
 
+# Prefer orjson for parsing JSON configs; it accepts bytes directly and is much
+# faster than the stdlib parser. orjson.JSONDecodeError subclasses ValueError.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Use the libyaml-backed dumper for templates when it is available
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 logger = get_logger(__name__)
 
+# Recognised boolean spellings for environment variable values
+_TRUE_VALUES = frozenset(('true', 'yes', '1', 'on'))
+_FALSE_VALUES = frozenset(('false', 'no', '0', 'off'))
+
+# Parsed config files keyed by resolved path: (mtime_ns, size, parsed data)
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+
+# Placeholder values for config templates, keyed by JSON schema type
+_TYPE_DEFAULTS = {
+    'string': lambda name: f"example_{name}",
+    'integer': lambda name: 1,
+    'number': lambda name: 1.0,
+    'boolean': lambda name: False,
+    'array': lambda name: [],
+}
+
 
 def load_config_file(config_path: Optional[str]) -> Dict[str, Any]:
     """
@@ -41,24 +73,57 @@ def load_config_file(config_path: Optional[str]) -> Dict[str, Any]:
     if not config_path.is_file():
         raise ConfigError(f"Config path is not a file: {config_path}")
     
+    # Reuse the parsed config if the file has not changed since it was last read
+    st = config_path.stat()
+    cache_key = str(config_path.resolve())
+    entry = _CONFIG_CACHE.get(cache_key)
+    if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        config = entry[2]
+    else:
+        config = _parse_config_file(config_path)
+        _CONFIG_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, config)
+    
+    # Hand out a copy so callers cannot modify the cached entry
+    return copy.deepcopy(config)
+
+
+def _parse_config_file(config_path: Path) -> Dict[str, Any]:
+    """
+    Parse a YAML or JSON config file, detecting the format from its content
+    when the suffix is not recognised.
+    
+    Args:
+        config_path (Path): Path to an existing config file.
+        
+    Returns:
+        Dict[str, Any]: Parameters loaded from file.
+        
+    Raises:
+        ConfigError: If config file cannot be loaded or parsed.
+    """
     try:
+        if config_path.suffix.lower() == '.json':
+            with open(config_path, 'rb') as f:
+                return _json_loads(f.read()) or {}
+
         with open(config_path, 'r', encoding='utf-8') as f:
-            if config_path.suffix.lower() == '.json':
-                return json.load(f) or {}
-            elif config_path.suffix.lower() in ('.yml', '.yaml'):
+            if config_path.suffix.lower() in ('.yml', '.yaml'):
                 return yaml.safe_load(f) or {}
             else:
-                # Try to detect format by content
+                # Try to detect format by content, attempting JSON first only
+                # when the document looks like a JSON object or array
                 content = f.read()
-                f.seek(0)
-                
-                try:
-                    return json.loads(content) or {}
-                except json.JSONDecodeError:
+                if content.lstrip()[:1] in ('{', '['):
+                    parsers = (_json_loads, yaml.safe_load)
+                else:
+                    parsers = (yaml.safe_load, _json_loads)
+
+                for parse in parsers:
                     try:
-                        return yaml.safe_load(content) or {}
-                    except yaml.YAMLError:
-                        raise ConfigError(f"Unable to parse config file as JSON or YAML: {config_path}")
+                        return parse(content) or {}
+                    except (ValueError, yaml.YAMLError):
+                        continue
+                raise ConfigError(f"Unable to parse config file as JSON or YAML: {config_path}")
     except Exception as e:
         if isinstance(e, ConfigError):
             raise
@@ -76,13 +141,12 @@ def load_env_vars(prefix: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Parameters from environment variables with type coercion.
     """
-    params = {}
-    for k, v in os.environ.items():
-        if k.startswith(prefix):
-            param_name = k[len(prefix):].lower()
-            # Basic type coercion
-            params[param_name] = _coerce_env_value(v)
-    return params
+    plen = len(prefix)
+    return {
+        k[plen:].lower(): _coerce_env_value(v)
+        for k, v in os.environ.items()
+        if k.startswith(prefix)
+    }
 
 
 def _coerce_env_value(value: str) -> Union[str, int, float, bool]:
@@ -95,21 +159,21 @@ def _coerce_env_value(value: str) -> Union[str, int, float, bool]:
     Returns:
         Union[str, int, float, bool]: Coerced value.
     """
-    # Handle boolean values
-    if value.lower() in ('true', 'yes', '1', 'on'):
+    lower = value.lower()
+    if lower in _TRUE_VALUES:
         return True
-    elif value.lower() in ('false', 'no', '0', 'off'):
+    if lower in _FALSE_VALUES:
         return False
     
-    # Handle numeric values
-    try:
-        # Try integer first
-        if '.' not in value and 'e' not in value.lower():
-            return int(value)
-        # Try float
-        return float(value)
-    except ValueError:
-        pass
+    # Only attempt numeric conversion when the value can plausibly be a number
+    first = value[:1]
+    if first and (first.isdigit() or first in '+-.'):
+        try:
+            if '.' not in value and 'e' not in lower:
+                return int(value)
+            return float(value)
+        except ValueError:
+            pass
     
     # Return as string
     return value
@@ -128,13 +192,22 @@ def merge_params(cli_args: Dict[str, Any], env_vars: Dict[str, Any], config: Dic
     Returns:
         Dict[str, Any]: Merged parameters.
     """
-    merged = dict(config)
-    merged.update(env_vars)
-    # Only update with CLI args that are not None
-    merged.update({k: v for k, v in cli_args.items() if v is not None})
+    # Only CLI args that are not None take part in the merge
+    filtered_cli = {k: v for k, v in cli_args.items() if v is not None}
     
     # Log the parameter sources for debugging
-    logger.debug(f"Parameter sources - Config: {len(config)} params, Env: {len(env_vars)} params, CLI: {len([k for k, v in cli_args.items() if v is not None])} params")
+    logger.debug(
+        "Parameter sources - Config: %d params, Env: %d params, CLI: %d params",
+        len(config), len(env_vars), len(filtered_cli)
+    )
+    
+    # Nothing to merge when there is no config file or environment input
+    if not config and not env_vars:
+        return filtered_cli
+    
+    merged = dict(config)
+    merged.update(env_vars)
+    merged.update(filtered_cli)
     
     return merged
 
@@ -188,46 +261,105 @@ def create_config_template(model: Type[BaseModel], format: str = 'yaml') -> str:
     Raises:
         CLIError: If format is not supported.
     """
+    return _build_template(model, format.lower())
+
+
+@functools.lru_cache(maxsize=64)
+def _build_template(model: Type[BaseModel], fmt: str) -> str:
+    """
+    Build and serialize a configuration template, cached per model and format.
+    
+    Args:
+        model (Type[BaseModel]): Pydantic model class.
+        fmt (str): Lowercase output format ('yaml' or 'json').
+        
+    Returns:
+        str: Configuration template as string.
+    """
     try:
-        # Get the model schema
-        if hasattr(model, 'model_json_schema'):
-            schema = model.model_json_schema()
-        else:
-            schema = model.schema()
+        return _dump_template(_build_example(model), fmt)
+    except Exception as e:
+        raise CLIError(f"Error creating config template: {str(e)}")
+
+
+@functools.lru_cache(maxsize=64)
+def _build_example(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build example configuration data from a Pydantic model's schema.
+    
+    The result is cached per model and must not be mutated by callers.
+    
+    Args:
+        model (Type[BaseModel]): Pydantic model class.
         
-        # Create example data from schema
-        example_data = {}
-        properties = schema.get('properties', {})
+    Returns:
+        Dict[str, Any]: Example parameter values keyed by field name.
+    """
+    schema = _get_schema(model)
+    
+    # Use example from schema if available
+    if 'example' in schema:
+        return schema['example']
+    
+    # Create example data from schema
+    example_data = {}
+    properties = schema.get('properties', {})
+    
+    for field_name, field_info in properties.items():
+        if 'default' in field_info:
+            example_data[field_name] = field_info['default']
+        elif 'example' in field_info:
+            example_data[field_name] = field_info['example']
+        else:
+            make_default = _TYPE_DEFAULTS.get(field_info.get('type'))
+            if make_default is not None:
+                example_data[field_name] = make_default(field_name)
+    
+    return example_data
+
+
+@functools.lru_cache(maxsize=128)
+def _get_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Get the JSON schema of a Pydantic model, cached per model class.
+    
+    The result is shared between callers and must not be mutated.
+    
+    Args:
+        model (Type[BaseModel]): Pydantic model class.
         
-        for field_name, field_info in properties.items():
-            if 'default' in field_info:
-                example_data[field_name] = field_info['default']
-            elif 'example' in field_info:
-                example_data[field_name] = field_info['example']
-            elif field_info.get('type') == 'string':
-                example_data[field_name] = f"example_{field_name}"
-            elif field_info.get('type') == 'integer':
-                example_data[field_name] = 1
-            elif field_info.get('type') == 'number':
-                example_data[field_name] = 1.0
-            elif field_info.get('type') == 'boolean':
-                example_data[field_name] = False
-            elif field_info.get('type') == 'array':
-                example_data[field_name] = []
+    Returns:
+        Dict[str, Any]: JSON schema of the model.
+    """
+    if hasattr(model, 'model_json_schema'):
+        return model.model_json_schema()
+    return model.schema()
+
+
+def _dump_template(example_data: Dict[str, Any], fmt: str, stream: Optional[IO[str]] = None) -> Optional[str]:
+    """
+    Serialize template data, either to a string or directly to a stream.
+    
+    Args:
+        example_data (Dict[str, Any]): Template data to serialize.
+        fmt (str): Lowercase output format ('yaml' or 'json').
+        stream (Optional[IO[str]]): Open text file to write to, if any.
         
-        # Use example from schema if available
-        if 'example' in schema:
-            example_data = schema['example']
+    Returns:
+        Optional[str]: Serialized template, or None when written to a stream.
         
-        if format.lower() == 'yaml':
-            return yaml.dump(example_data, default_flow_style=False, sort_keys=True)
-        elif format.lower() == 'json':
+    Raises:
+        CLIError: If format is not supported.
+    """
+    if fmt == 'yaml':
+        return yaml.dump(example_data, stream, Dumper=_YamlDumper, default_flow_style=False, sort_keys=True)
+    elif fmt == 'json':
+        if stream is None:
             return json.dumps(example_data, indent=2, sort_keys=True)
-        else:
-            raise CLIError(f"Unsupported config format: {format}. Use 'yaml' or 'json'.")
-            
-    except Exception as e:
-        raise CLIError(f"Error creating config template: {str(e)}")
+        json.dump(example_data, stream, indent=2, sort_keys=True)
+        return None
+    else:
+        raise CLIError(f"Unsupported config format: {fmt}. Use 'yaml' or 'json'.")
 
 
 def save_config_template(model: Type[BaseModel], output_path: Path, format: str = 'yaml') -> None:
@@ -243,15 +375,20 @@ def save_config_template(model: Type[BaseModel], output_path: Path, format: str
         CLIError: If template cannot be saved.
     """
     try:
-        template = create_config_template(model, format)
+        fmt = format.lower()
+        if fmt not in ('yaml', 'json'):
+            raise CLIError(f"Unsupported config format: {format}. Use 'yaml' or 'json'.")
+        
+        example_data = _build_example(model)
         
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # Serialize straight into the file rather than building a string first
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(template)
+            _dump_template(example_data, fmt, f)
             
-        logger.info(f"Configuration template saved to: {output_path}")
+        logger.info("Configuration template saved to: %s", output_path)
         
     except Exception as e:
         raise CLIError(f"Error saving config template to {output_path}: {str(e)}")
@@ -6,31 +6,58 @@ progress indication, and parameter management to ensure consistency across
 all CLI commands.
 """
 
+import functools
 import sys
-from typing import Any, Dict, List, Optional, Union, Type
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, Type
 from pathlib import Path
 
 import click
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    from rich.table import Table
+
 from ionspid.utils.exceptions import iONspIDError, CLIError, InputError, ProcessingError, ConfigError
-from ionspid.utils.logging import get_logger
+from ionspid.utils.logging import get_console, get_logger
 from ionspid.cli.utils.param_loader import load_config_file, load_env_vars, merge_params, validate_parameters
 
 logger = get_logger(__name__)
 
-# Try to import Rich for enhanced output formatting
-try:
-    from rich.console import Console
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+
+@functools.lru_cache(maxsize=1)
+def _rich() -> Optional[SimpleNamespace]:
+    """
+    Import Rich on first use for enhanced output formatting.
+    
+    Rich is only imported once a handler actually produces Rich output, which
+    keeps it off the import path of every CLI command.
+    
+    Returns:
+        Namespace with a shared Console and the Rich classes used here, or None
+        if Rich is not installed.
+    """
+    console = get_console()
+    if console is None:
+        return None
     from rich.table import Table
-    from rich.panel import Panel
     from rich.traceback import Traceback
-    RICH_AVAILABLE = True
-    console = Console()
-except ImportError:
-    RICH_AVAILABLE = False
-    console = None
+    return SimpleNamespace(console=console, Table=Table, Traceback=Traceback)
+
+
+@functools.lru_cache(maxsize=32)
+def _error_prefixes(etype: type) -> tuple:
+    """
+    Build the Rich and plain-text message prefixes for an error type.
+    
+    Args:
+        etype (type): Exception class.
+        
+    Returns:
+        tuple: (rich_prefix, plain_prefix)
+    """
+    name = etype.__name__ if issubclass(etype, iONspIDError) else "Unexpected Error"
+    return f"[bold red]✗ {name}[/bold red]", f"✗ {name}"
 
 
 class StandardCLIHandler:
@@ -53,15 +80,25 @@ class StandardCLIHandler:
             use_rich (bool): Whether to use Rich formatting if available.
         """
         self.command_name = command_name
-        self.use_rich = use_rich and RICH_AVAILABLE
+        self._use_rich = use_rich
         self.logger = get_logger(f"cli.{command_name}")
     
+    @property
+    def use_rich(self) -> bool:
+        """Whether Rich formatting is requested and available."""
+        return self._get_rich() is not None
+    
+    def _get_rich(self) -> Optional[SimpleNamespace]:
+        """Get the lazily imported Rich namespace, or None for plain output."""
+        return _rich() if self._use_rich else None
+    
     def load_and_validate_params(
         self, 
         cli_args: Dict[str, Any], 
         param_model: Type[BaseModel],
         config_path: Optional[str] = None,
-        env_prefix: Optional[str] = None
+        env_prefix: Optional[str] = None,
+        trusted: bool = False
     ) -> BaseModel:
         """
         Load and validate parameters using the standardized parameter loading system.
@@ -71,6 +108,8 @@ class StandardCLIHandler:
             param_model (Type[BaseModel]): Pydantic model for parameter validation.
             config_path (Optional[str]): Path to configuration file.
             env_prefix (Optional[str]): Environment variable prefix.
+            trusted (bool): Build the model without validation. Only use this when
+                all parameter sources are known to hold valid values.
             
         Returns:
             BaseModel: Validated parameter instance.
@@ -88,8 +127,11 @@ class StandardCLIHandler:
             # Merge parameters with correct precedence
             merged_params = merge_params(cli_args, env_params, config_params)
             
-            # Validate parameters
-            validated_params = validate_parameters(merged_params, param_model)
+            # Validate parameters, or skip validation for trusted sources
+            if trusted:
+                validated_params = param_model.model_construct(**merged_params)
+            else:
+                validated_params = validate_parameters(merged_params, param_model)
             
             self.logger.debug(f"Parameters loaded and validated successfully for {self.command_name}")
             
@@ -121,29 +163,27 @@ class StandardCLIHandler:
         # Log the error
         self.logger.error(f"{context}: {str(error)}", exc_info=show_traceback)
         
-        if self.use_rich:
-            self._handle_error_rich(error, context, show_traceback)
+        rich = self._get_rich()
+        if rich is not None:
+            self._handle_error_rich(rich, error, context, show_traceback)
         else:
             self._handle_error_plain(error, context, show_traceback)
     
-    def _handle_error_rich(self, error: Exception, context: str, show_traceback: bool) -> None:
+    def _handle_error_rich(self, rich: SimpleNamespace, error: Exception, context: str, show_traceback: bool) -> None:
         """Handle error output using Rich formatting."""
-        if isinstance(error, iONspIDError):
-            console.print(f"[bold red]✗ {error.__class__.__name__}[/bold red]: {str(error)}")
-        else:
-            console.print(f"[bold red]✗ Unexpected Error[/bold red]: {str(error)}")
+        console = rich.console
+        console.print(f"{_error_prefixes(type(error))[0]}: {error}")
         
         if context:
             console.print(f"[dim]Context: {context}[/dim]")
         
         if show_traceback:
-            tb = Traceback.from_exception(type(error), error, error.__traceback__)
+            tb = rich.Traceback.from_exception(type(error), error, error.__traceback__)
             console.print(tb)
     
     def _handle_error_plain(self, error: Exception, context: str, show_traceback: bool) -> None:
         """Handle error output using plain text formatting."""
-        error_type = error.__class__.__name__ if isinstance(error, iONspIDError) else "Unexpected Error"
-        click.echo(f"✗ {error_type}: {str(error)}", err=True)
+        click.echo(f"{_error_prefixes(type(error))[1]}: {error}", err=True)
         
         if context:
             click.echo(f"Context: {context}", err=True)
@@ -160,7 +200,9 @@ class StandardCLIHandler:
             message (str): Success message.
             details (Optional[Dict[str, Any]]): Additional details to display.
         """
-        if self.use_rich:
+        rich = self._get_rich()
+        if rich is not None:
+            console = rich.console
             console.print(f"[bold green]✓[/bold green] {message}")
             if details:
                 for key, value in details.items():
@@ -179,7 +221,9 @@ class StandardCLIHandler:
             message (str): Info message.
             details (Optional[Dict[str, Any]]): Additional details to display.
         """
-        if self.use_rich:
+        rich = self._get_rich()
+        if rich is not None:
+            console = rich.console
             console.print(f"[bold blue]ℹ[/bold blue] {message}")
             if details:
                 for key, value in details.items():
@@ -198,7 +242,9 @@ class StandardCLIHandler:
             message (str): Warning message.
             details (Optional[Dict[str, Any]]): Additional details to display.
         """
-        if self.use_rich:
+        rich = self._get_rich()
+        if rich is not None:
+            console = rich.console
             console.print(f"[bold yellow]⚠[/bold yellow] {message}")
             if details:
                 for key, value in details.items():
@@ -219,8 +265,9 @@ class StandardCLIHandler:
         Returns:
             Context manager for progress indication.
         """
-        if self.use_rich:
-            return console.status(f"[bold cyan]{description}")
+        rich = self._get_rich()
+        if rich is not None:
+            return rich.console.status(f"[bold cyan]{description}")
         else:
             return _PlainProgressContext(description)
     
@@ -235,8 +282,9 @@ class StandardCLIHandler:
         Returns:
             Table object (Rich Table or plain text equivalent).
         """
-        if self.use_rich:
-            table = Table(title=title)
+        rich = self._get_rich()
+        if rich is not None:
+            table = rich.Table(title=title)
             for column in columns:
                 table.add_column(column)
             return table
@@ -250,8 +298,9 @@ class StandardCLIHandler:
         Args:
             table: Table object to print.
         """
-        if self.use_rich and hasattr(table, 'add_row'):
-            console.print(table)
+        rich = self._get_rich()
+        if rich is not None and not isinstance(table, _PlainTable):
+            rich.console.print(table)
         else:
             table.print()
 
@@ -284,42 +333,39 @@ class _PlainTable:
     
     def add_row(self, *values):
         """Add a row to the table."""
-        row = list(values)
+        row = [str(value) for value in values]
         self.rows.append(row)
         # Update column widths
-        for i, value in enumerate(row):
-            if i < len(self.col_widths):
-                self.col_widths[i] = max(self.col_widths[i], len(str(value)))
+        widths = self.col_widths
+        for i, cell in enumerate(row[:len(widths)]):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
     
     def print(self):
         """Print the table in plain text format."""
-        if self.title:
-            click.echo(f"\n{self.title}")
-            click.echo("=" * len(self.title))
+        widths = self.col_widths
+        row_fmt = " | ".join(f"{{:<{width}}}" for width in widths)
         
-        # Print header
-        header_parts = []
-        for i, col in enumerate(self.columns):
-            width = self.col_widths[i] if i < len(self.col_widths) else len(col)
-            header_parts.append(col.ljust(width))
-        click.echo(" | ".join(header_parts))
+        lines = []
+        if self.title:
+            lines.append(f"\n{self.title}")
+            lines.append("=" * len(self.title))
         
-        # Print separator
-        sep_parts = []
-        for i, col in enumerate(self.columns):
-            width = self.col_widths[i] if i < len(self.col_widths) else len(col)
-            sep_parts.append("-" * width)
-        click.echo("-|-".join(sep_parts))
+        # Header and separator
+        lines.append(row_fmt.format(*self.columns))
+        lines.append("-|-".join("-" * width for width in widths))
         
-        # Print rows
+        # Rows; cells beyond the known columns are left unpadded
         for row in self.rows:
-            row_parts = []
-            for i, value in enumerate(row):
-                width = self.col_widths[i] if i < len(self.col_widths) else len(str(value))
-                row_parts.append(str(value).ljust(width))
-            click.echo(" | ".join(row_parts))
+            if len(row) == len(widths):
+                lines.append(row_fmt.format(*row))
+            else:
+                lines.append(" | ".join(
+                    cell.ljust(widths[i]) if i < len(widths) else cell
+                    for i, cell in enumerate(row)
+                ))
         
-        click.echo()
+        click.echo("\n".join(lines) + "\n")
 
 
 def get_standard_cli_options():
@@ -388,6 +434,12 @@ def apply_standard_options(func):
     Returns:
         Decorated function with standard options applied.
     """
-    for option in reversed(get_standard_cli_options()):
+    for option in _STANDARD_OPTIONS:
         func = option(func)
     return func
+
+
+# Standard option decorators in application order, built once at import.
+# Each click.option decorator creates a fresh Option when applied, so the
+# same decorators can safely be reused for every command.
+_STANDARD_OPTIONS = tuple(reversed(get_standard_cli_options()))
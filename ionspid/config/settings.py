@@ -4,7 +4,11 @@ Settings management for iONspID.
 This module provides functionality for loading, validating, and accessing application settings.
 """
 
+import functools
+import json
 import os
+import re
+import sys
 import yaml
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
@@ -13,6 +17,17 @@ from pydantic import BaseModel, Field, ValidationError
 
 from ionspid.utils.logging import get_logger
 
+# Prefer orjson for writing JSON settings files and libyaml for YAML when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 logger = get_logger(__name__)
 
 
@@ -62,35 +77,58 @@ class Settings(BaseModel):
         extra = "forbid"  # Forbid extra attributes
 
 
+# Placeholders supported in path settings
+_PLACEHOLDER_RE = re.compile(r"\{user_(?:home|data|temp)\}")
+
+
+@functools.lru_cache(maxsize=1)
+def _path_placeholders() -> Dict[str, str]:
+    """
+    Resolve the values of path placeholders once per process.
+    
+    Returns:
+        Mapping of placeholder to its expanded value
+    """
+    home = Path.home()
+    if os.name == "posix":
+        if sys.platform == "darwin":
+            user_data = home / "Library" / "Application Support"
+        else:
+            user_data = home / ".local" / "share"
+        user_temp = Path(os.getenv("TMPDIR", "/tmp"))
+    else:
+        user_data = home / "AppData" / "Local"
+        user_temp = Path(os.getenv("TEMP", "C:\\Temp"))
+    
+    return {
+        "{user_home}": str(home),
+        "{user_data}": str(user_data),
+        "{user_temp}": str(user_temp),
+    }
+
+
 class SettingsManager:
     """
     Manager for application settings.
     
-    This class provides a singleton interface for loading, validating, and accessing
+    This class provides an interface for loading, validating, and accessing
     application settings from configuration files and environment variables.
+    The application-wide instance is available via get_settings_manager().
     """
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(SettingsManager, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
     
     def __init__(self):
-        if self._initialized:
-            return
-            
-        self._initialized = True
         self._settings = Settings()
         self._config_file = None
+        # Expanded directory paths keyed by their unexpanded setting value
+        self._dir_cache: Dict[str, Path] = {}
     
     def load_settings(self, config_file: Optional[Union[str, Path]] = None) -> None:
         """
         Load settings from a configuration file.
         
         Args:
-            config_file: Path to the configuration file (YAML format)
+            config_file: Path to the configuration file (YAML, or JSON with a
+                        .json extension)
         """
         if config_file is not None:
             config_file = Path(config_file)
@@ -100,14 +138,21 @@ class SettingsManager:
                 return
                 
             try:
-                with open(config_file, 'r') as f:
-                    config_data = yaml.safe_load(f)
+                if config_file.suffix.lower() == '.json':
+                    # Parsed and validated in one pass by pydantic-core
+                    with open(config_file, 'rb') as f:
+                        settings = Settings.model_validate_json(f.read())
+                else:
+                    # Hand libyaml the raw byte stream so it decodes in C
+                    with open(config_file, 'rb') as f:
+                        config_data = yaml.load(f, Loader=_YamlLoader)
+                    settings = Settings.model_validate(config_data)
                     
-                self._settings = Settings.parse_obj(config_data)
+                self._settings = settings
                 self._config_file = config_file
                 logger.info(f"Loaded settings from {config_file}")
                 
-            except (yaml.YAMLError, ValidationError) as e:
+            except (yaml.YAMLError, ValueError, ValidationError) as e:
                 logger.error(f"Error loading configuration: {e}")
     
     def get_settings(self) -> Settings:
@@ -119,22 +164,28 @@ class SettingsManager:
         """
         return self._settings
     
-    def update_settings(self, settings_dict: Dict[str, Any]) -> None:
+    def update_settings(self, settings_dict: Dict[str, Any], validate: bool = True) -> None:
         """
         Update settings with new values.
         
         Args:
             settings_dict: Dictionary of settings to update
+            validate: Whether to re-validate the merged settings. When False, the
+                     values are applied without validation; a dict given for a
+                     section (e.g. "core") is merged into that section's model.
         """
+        if not validate:
+            updates = {}
+            for key, value in settings_dict.items():
+                current = getattr(self._settings, key, None)
+                if isinstance(current, BaseModel) and isinstance(value, dict):
+                    value = current.model_copy(update=value)
+                updates[key] = value
+            self._settings = self._settings.model_copy(update=updates)
+            return
+        
         try:
-            # Create a dictionary with current settings
-            current_dict = self._settings.dict()
-            
-            # Update with new values
-            current_dict.update(settings_dict)
-            
-            # Parse updated dictionary
-            self._settings = Settings.parse_obj(current_dict)
+            self._settings = Settings.model_validate({**self._settings.model_dump(), **settings_dict})
             
         except ValidationError as e:
             logger.error(f"Error updating settings: {e}")
@@ -162,14 +213,23 @@ class SettingsManager:
             # Ensure the directory exists
             config_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Save settings as YAML
-            with open(config_file, 'w') as f:
-                yaml.dump(self._settings.dict(), f, default_flow_style=False)
+            # Save settings as JSON for .json files, YAML otherwise
+            settings_data = self._settings.model_dump()
+            if config_file.suffix.lower() == '.json':
+                if orjson is not None:
+                    with open(config_file, 'wb') as f:
+                        f.write(orjson.dumps(settings_data, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(config_file, 'w') as f:
+                        json.dump(settings_data, f, indent=2)
+            else:
+                with open(config_file, 'w') as f:
+                    yaml.dump(settings_data, f, Dumper=_YamlDumper, default_flow_style=False)
                 
             logger.info(f"Saved settings to {config_file}")
             return True
             
-        except (OSError, yaml.YAMLError) as e:
+        except (OSError, TypeError, yaml.YAMLError) as e:
             logger.error(f"Error saving configuration: {e}")
             return False
     
@@ -183,25 +243,12 @@ class SettingsManager:
         Returns:
             Expanded path string
         """
-        # Define common placeholders
-        placeholders = {
-            "{user_home}": str(Path.home()),
-            "{user_data}": str(Path.home() / "Library" / "Application Support" 
-                              if os.name == "posix" and sys.platform == "darwin"
-                              else Path.home() / ".local" / "share" 
-                              if os.name == "posix"
-                              else Path.home() / "AppData" / "Local"),
-            "{user_temp}": str(Path(os.getenv("TMPDIR", "/tmp")) 
-                              if os.name == "posix"
-                              else Path(os.getenv("TEMP", "C:\\Temp")))
-        }
+        # Nothing to expand without a placeholder
+        if "{" not in path:
+            return path
         
-        # Replace placeholders
-        result = path
-        for placeholder, value in placeholders.items():
-            result = result.replace(placeholder, value)
-            
-        return result
+        placeholders = _path_placeholders()
+        return _PLACEHOLDER_RE.sub(lambda m: placeholders[m.group(0)], path)
     
     def get_temp_dir(self) -> Path:
         """
@@ -210,8 +257,7 @@ class SettingsManager:
         Returns:
             Path object to the temporary directory
         """
-        temp_dir = self.expand_path(self._settings.core.temp_dir)
-        return Path(temp_dir)
+        return self._expand_dir(self._settings.core.temp_dir)
     
     def get_data_dir(self) -> Path:
         """
@@ -220,8 +266,39 @@ class SettingsManager:
         Returns:
             Path object to the data directory
         """
-        data_dir = self.expand_path(self._settings.core.data_dir)
-        return Path(data_dir)
+        return self._expand_dir(self._settings.core.data_dir)
+    
+    def _expand_dir(self, path: str) -> Path:
+        """
+        Expand a directory setting into a Path, reusing earlier results.
+        
+        Results are keyed by the unexpanded value, so updated settings are
+        picked up without explicit invalidation.
+        
+        Args:
+            path: Path string with placeholders
+            
+        Returns:
+            Expanded Path object
+        """
+        expanded = self._dir_cache.get(path)
+        if expanded is None:
+            expanded = self._dir_cache[path] = Path(self.expand_path(path))
+        return expanded
+
+
+# Application-wide settings manager
+_SETTINGS_MANAGER = SettingsManager()
+
+
+def get_settings_manager() -> SettingsManager:
+    """
+    Get the application-wide settings manager.
+    
+    Returns:
+        Shared SettingsManager instance
+    """
+    return _SETTINGS_MANAGER
 
 
 # Convenience function to get the settings
@@ -232,9 +309,4 @@ def get_settings() -> Settings:
     Returns:
         Current settings object
     """
-    return SettingsManager().get_settings()
-
-
-# Import for the side effect of exposing os and sys
-import os
-import sys
+    return _SETTINGS_MANAGER._settings
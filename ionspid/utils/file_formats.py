@@ -6,7 +6,7 @@ This module defines supported file formats, provides validation, detection, and
 
 from enum import Enum
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 class FileFormat(str, Enum):
     POD5 = "pod5"
@@ -30,6 +30,26 @@ FORMAT_EXTENSIONS = {
     FileFormat.TAXONOMY: [".tax", ".taxonomy", ".kraken", ".centrifuge", ".txt", ".tsv", ".csv"],
 }
 
+# Extensions of compressed files (lowercase, with dot)
+COMPRESSED_SUFFIXES = frozenset((".gz", ".bgz", ".zst", ".bz2"))
+
+
+def _build_extension_lookup() -> Dict[str, FileFormat]:
+    """
+    Build a reverse mapping of extension to file format.
+
+    Extensions shared by several formats (e.g. ".txt") map to the format
+    listed first in FORMAT_EXTENSIONS.
+    """
+    lookup: Dict[str, FileFormat] = {}
+    for format_type, extensions in FORMAT_EXTENSIONS.items():
+        for ext in extensions:
+            lookup.setdefault(ext, format_type)
+    return lookup
+
+
+_EXT_TO_FORMAT = _build_extension_lookup()
+
 
 def detect_format(file_path: Path) -> FileFormat:
     """
@@ -51,18 +71,19 @@ def detect_format(file_path: Path) -> FileFormat:
     single_suffix = file_path.suffix.lower()
     
     # Check both full suffix and single suffix
-    for format_type, extensions in FORMAT_EXTENSIONS.items():
-        if full_suffix in extensions or single_suffix in extensions:
-            return format_type
+    format_type = _EXT_TO_FORMAT.get(full_suffix)
+    if format_type is None:
+        format_type = _EXT_TO_FORMAT.get(single_suffix)
     
-    # Special handling for common compressed formats
-    if full_suffix.endswith('.gz'):
-        base_suffix = full_suffix[:-3]  # Remove .gz
-        for format_type, extensions in FORMAT_EXTENSIONS.items():
-            if base_suffix in extensions:
-                return format_type
+    # Special handling for compressed formats: look up the inner extension
+    if format_type is None and single_suffix in COMPRESSED_SUFFIXES:
+        format_type = _EXT_TO_FORMAT.get(full_suffix[:-len(single_suffix)])
+        if format_type is None:
+            format_type = _EXT_TO_FORMAT.get(file_path.with_suffix("").suffix.lower())
     
-    raise ValueError(f"Cannot determine file format for: {file_path}")
+    if format_type is None:
+        raise ValueError(f"Cannot determine file format for: {file_path}")
+    return format_type
 
 
 def is_supported_format(
@@ -103,5 +124,5 @@ def get_format_extensions(format_type: FileFormat) -> List[str]:
 
 def is_compressed(file_path: Path) -> bool:
     """Check if file is compressed based on extension."""
-    return str(file_path).lower().endswith('.gz')
+    return Path(file_path).suffix.lower() in COMPRESSED_SUFFIXES
 
@@ -4,12 +4,53 @@ File utilities for iONspID.
 This module provides helper functions for file operations and path management.
 """
 
+import errno
 import os
+import re
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Union, Iterator
 from ionspid.utils.file_formats import detect_format, is_supported_format, FileFormat
 
+# Chunk size for copies with progress reporting
+COPY_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+# Directory trees with at least this many files are removed with parallel unlinks
+PARALLEL_REMOVE_THRESHOLD = 10000
+
+# fd-relative removal is needed to walk large trees without following
+# symlinks swapped in during removal
+_FD_REMOVE_SUPPORTED = (
+    hasattr(os, 'fwalk')
+    and os.unlink in os.supports_dir_fd
+    and os.rmdir in os.supports_dir_fd
+)
+
+# Glob patterns that only match on a literal suffix, e.g. "*.fastq" or "*.fq.gz"
+_SIMPLE_SUFFIX_PATTERN = re.compile(r'\*\.[\w.]+')
+
+# os.sendfile only supports regular-file destinations on Linux
+_USE_SENDFILE = sys.platform.startswith('linux') and hasattr(os, 'sendfile')
+
+# Errors meaning sendfile cannot be used for this file pair
+_SENDFILE_UNSUPPORTED_ERRNOS = frozenset((errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP))
+
+# Linux ioctl that shares the source extents with the destination on
+# copy-on-write filesystems (Btrfs, XFS with reflink, ZFS)
+if sys.platform.startswith('linux'):
+    import fcntl
+    _FICLONE = 0x40049409
+else:
+    fcntl = None
+    _FICLONE = None
+
+# Errors meaning the filesystem cannot clone this file pair
+_CLONE_UNSUPPORTED_ERRNOS = frozenset(
+    (errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EBADF)
+)
+
 
 def ensure_directory(directory: Union[str, Path]) -> Path:
     """
@@ -60,6 +101,21 @@ def find_files(directory: Union[str, Path], pattern: str) -> List[Path]:
         List of matching file paths
     """
     directory = Path(directory)
+    
+    # Fast path for simple "*.ext" patterns: one scandir pass with a suffix
+    # check instead of the generic glob machinery
+    if _SIMPLE_SUFFIX_PATTERN.fullmatch(pattern):
+        suffix = os.path.normcase(pattern[1:])
+        try:
+            with os.scandir(directory) as entries:
+                return [
+                    Path(entry.path) for entry in entries
+                    if os.path.normcase(entry.name).endswith(suffix)
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            # Path.glob yields nothing for a missing or non-directory path
+            return []
+    
     return list(directory.glob(pattern))
 
 
@@ -79,25 +135,83 @@ def copy_with_progress(
     """
     src, dst = Path(src), Path(dst)
     
+    # Make sure destination directory exists
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    
+    # On copy-on-write filesystems a clone replaces the copy entirely
+    if _try_reflink(src, dst):
+        if callback is not None:
+            file_size = dst.stat().st_size
+            callback(file_size, file_size)
+        return
+    
+    # Without progress reporting, let shutil use the platform's fast copy path
+    if callback is None:
+        shutil.copyfile(src, dst)
+        return
+    
     # Get file size for progress reporting
     file_size = src.stat().st_size
     bytes_copied = 0
     
-    # Make sure destination directory exists
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    
     # Copy with progress reporting
     with src.open('rb') as fsrc, dst.open('wb') as fdst:
+        if _USE_SENDFILE:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            while True:
+                try:
+                    sent = os.sendfile(dst_fd, src_fd, bytes_copied, COPY_CHUNK_SIZE)
+                except OSError as e:
+                    if e.errno not in _SENDFILE_UNSUPPORTED_ERRNOS:
+                        raise
+                    # sendfile is not supported for this file pair; continue
+                    # with a buffered copy from where it stopped
+                    fsrc.seek(bytes_copied)
+                    break
+                if sent == 0:
+                    return
+                bytes_copied += sent
+                callback(bytes_copied, file_size)
+        
         while True:
-            buf = fsrc.read(8192)  # 8KB chunks
+            buf = fsrc.read(COPY_CHUNK_SIZE)
             if not buf:
                 break
                 
             fdst.write(buf)
             bytes_copied += len(buf)
-            
-            if callback is not None:
-                callback(bytes_copied, file_size)
+            callback(bytes_copied, file_size)
+
+
+def _try_reflink(src: Path, dst: Path) -> bool:
+    """
+    Clone src into dst without copying data, if the filesystem supports it.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path
+        
+    Returns:
+        True if dst was cloned from src, False if a regular copy is needed
+    """
+    if _FICLONE is None:
+        return False
+    
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        except OSError as e:
+            if e.errno in _CLONE_UNSUPPORTED_ERRNOS:
+                return False
+            raise
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    
+    return True
 
 
 def safe_remove(path: Union[str, Path]) -> None:
@@ -115,7 +229,86 @@ def safe_remove(path: Union[str, Path]) -> None:
     if path.is_file():
         path.unlink()
     elif path.is_dir():
-        shutil.rmtree(path)
+        _remove_tree(path)
+
+
+def _remove_tree(root: Path, workers: int = 8) -> None:
+    """
+    Remove a directory tree, unlinking files in parallel for large trees.
+    
+    Unlinking is I/O-bound, so on network filesystems spreading it across
+    threads hides per-file latency. Trees below PARALLEL_REMOVE_THRESHOLD
+    files are left to shutil.rmtree. Large trees are walked with os.fwalk
+    and every entry is removed relative to an open directory fd, so a
+    directory swapped for a symlink during removal is never followed.
+    
+    Args:
+        root: Directory to remove
+        workers: Number of threads used for large trees
+        
+    Raises:
+        OSError: If root is a symlink, as shutil.rmtree does
+    """
+    if os.path.islink(root):
+        raise OSError("Cannot call rmtree on a symbolic link")
+    
+    if not _FD_REMOVE_SUPPORTED or _count_files(root, PARALLEL_REMOVE_THRESHOLD) < PARALLEL_REMOVE_THRESHOLD:
+        shutil.rmtree(root)
+        return
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for _, dirnames, filenames, dir_fd in os.fwalk(
+            root, topdown=False, onerror=_raise_error, follow_symlinks=False
+        ):
+            for _ in pool.map(lambda name: _unlink_missing_ok(name, dir_fd), filenames):
+                pass
+            # Subdirectories have already been emptied (bottom-up walk);
+            # fwalk lists symlinks to directories here too, without entering them
+            for name in dirnames:
+                try:
+                    os.rmdir(name, dir_fd=dir_fd)
+                except NotADirectoryError:
+                    _unlink_missing_ok(name, dir_fd)
+    
+    os.rmdir(root)
+
+
+def _count_files(root: Path, limit: int) -> int:
+    """
+    Count non-directory entries under root, stopping once limit is reached.
+    
+    Args:
+        root: Directory to count in
+        limit: Count at which to stop walking
+        
+    Returns:
+        Number of entries found, at most limit
+    """
+    count = 0
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                else:
+                    count += 1
+                    if count >= limit:
+                        return count
+    return count
+
+
+def _raise_error(error: OSError) -> None:
+    """os.fwalk error callback that propagates the error, as shutil.rmtree does."""
+    raise error
+
+
+def _unlink_missing_ok(name: str, dir_fd: int) -> None:
+    """Unlink an entry of an open directory, ignoring already removed entries."""
+    try:
+        os.unlink(name, dir_fd=dir_fd)
+    except FileNotFoundError:
+        pass
 
 
 def validate_output_path(
@@ -134,33 +327,48 @@ def validate_output_path(
     """
     path = Path(path)
     
-    # Check if parent directory exists
-    if not path.parent.exists():
-        return False
+    # An existing path implies an existing parent, so one stat decides
+    # most cases; only a missing path needs the parent checked
+    try:
+        os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return path.parent.is_dir()
     
-    # Check if path exists and whether overwriting is allowed
-    if path.exists() and not overwrite:
-        return False
-        
-    return True
+    return overwrite
 
 
-def iterate_chunks(file_path: Union[str, Path], chunk_size: int = 4096) -> Iterator[bytes]:
+def iterate_chunks(
+    file_path: Union[str, Path], 
+    chunk_size: int = 1024 * 1024, 
+    reuse_buffer: bool = False
+) -> Iterator[Union[bytes, memoryview]]:
     """
     Iterate over a file in chunks.
     
     Args:
         file_path: Path to the file
         chunk_size: Size of each chunk in bytes
+        reuse_buffer: Read every chunk into one preallocated buffer and yield
+                      memoryviews of it instead of allocating new bytes objects.
+                      Each view is only valid until the next chunk is read.
         
     Yields:
-        File chunks as bytes
+        File chunks as bytes, or as memoryviews when reuse_buffer is True
     """
     file_path = Path(file_path)
     
     with file_path.open('rb') as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            yield chunk
+        if reuse_buffer:
+            buf = bytearray(chunk_size)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                yield view[:n]
+        else:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
@@ -5,22 +5,55 @@ This module provides a comprehensive logging system with hierarchical loggers,
 configurable outputs, and log rotation.
 """
 
+import atexit
+import json
 import logging
 import logging.handlers
 import os
+import queue
+import stat
 import sys
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-import yaml
-from rich.logging import RichHandler
-from rich.console import Console
-from rich.traceback import install as rich_traceback_install
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 # Default log format
 DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 # More detailed format for file logging
 DETAILED_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
 
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that formats the timestamp's date and time once per second.
+    
+    Records logged within the same second reuse the strftime() result, so
+    only the milliseconds are formatted per record.
+    """
+    
+    def __init__(self, fmt: Optional[str] = None):
+        super().__init__(fmt)
+        # (whole seconds, formatted date and time) of the last record
+        self._time_cache: Tuple[int, str] = (-1, "")
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        seconds = int(record.created)
+        cached_seconds, text = self._time_cache
+        if cached_seconds != seconds:
+            text = time.strftime(self.default_time_format, self.converter(record.created))
+            self._time_cache = (seconds, text)
+        return self.default_msec_format % (text, record.msecs)
+
+
+# Formatters shared by all handlers; Formatter holds no per-handler state
+_DEFAULT_FMT = _CachedTimeFormatter(DEFAULT_FORMAT)
+_DETAILED_FMT = _CachedTimeFormatter(DETAILED_FORMAT)
+
 # Define log levels with user-friendly names
 LOG_LEVELS = {
     "debug": logging.DEBUG,
@@ -30,6 +63,343 @@ LOG_LEVELS = {
     "critical": logging.CRITICAL
 }
 
+# Level lookup that also accepts canonical upper-case names without lowering
+_LEVEL_LOOKUP = {**LOG_LEVELS, **{k.upper(): v for k, v in LOG_LEVELS.items()}}
+
+# Write buffer size for log files; records are flushed when the queue drains
+FILE_BUFFER_SIZE = 64 * 1024
+
+# Syslog facility names accepted in YAML configs, e.g. "user" or "local0"
+_FACILITY_MAP = dict(logging.handlers.SysLogHandler.facility_names)
+
+# Parsed logging configs keyed by resolved path: (mtime_ns, size, config)
+_YAML_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+
+
+def _load_yaml_config(config_path: Union[str, Path]) -> Any:
+    """
+    Load a YAML logging config, reusing the parsed result while the file is unchanged.
+    
+    Args:
+        config_path: Path to the YAML configuration file
+        
+    Returns:
+        Parsed configuration
+    """
+    st = os.stat(config_path)
+    key = os.fspath(Path(config_path).resolve())
+    entry = _YAML_CACHE.get(key)
+    if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+    
+    # A JSON sidecar written from this exact YAML file skips YAML parsing
+    sidecar = key + ".cache.json"
+    try:
+        with open(sidecar, 'rb') as f:
+            cached = json.load(f)
+        if (isinstance(cached, dict) and cached.get("mtime_ns") == st.st_mtime_ns
+                and cached.get("size") == st.st_size and "config" in cached):
+            config = cached["config"]
+            _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, config)
+            return config
+    except (OSError, ValueError):
+        pass
+    
+    # Imported here so that only YAML-configured runs pay for it
+    import yaml
+    try:
+        from yaml import CSafeLoader as _SafeLoader
+    except ImportError:
+        from yaml import SafeLoader as _SafeLoader
+    
+    # A binary stream lets libyaml decode the file itself
+    with open(config_path, 'rb') as f:
+        config = yaml.load(f, Loader=_SafeLoader)
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, config)
+    _write_json_sidecar(sidecar, config, st)
+    return config
+
+
+def _write_json_sidecar(sidecar: str, config: Any, source_stat: os.stat_result) -> None:
+    """
+    Atomically write a JSON copy of a parsed YAML config, if possible.
+    
+    The sidecar records the mtime and size of the YAML file it was built from
+    and is only reused while both match exactly. Configs that do not survive a
+    JSON round trip unchanged (e.g. dates or non-string keys) and unwritable
+    directories are silently skipped.
+    
+    Args:
+        sidecar: Path of the JSON sidecar file
+        config: Parsed configuration
+        source_stat: Stat result of the YAML file the config was parsed from
+    """
+    try:
+        text = json.dumps(config)
+        if json.loads(text) != config:
+            return
+        text = json.dumps({
+            "mtime_ns": source_stat.st_mtime_ns,
+            "size": source_stat.st_size,
+            "config": config,
+        })
+    except (TypeError, ValueError):
+        return
+    
+    tmp = f"{sidecar}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'w') as f:
+            f.write(text)
+        os.replace(tmp, sidecar)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that formats each record once and tracks the file
+    size itself.
+    
+    The stock handler formats every record a second time and asks the stream
+    for its position to decide on rollover, which also forces buffered data
+    out to the file. Here the size is read once when the file is opened and
+    then advanced by the encoded length of each record written.
+    """
+    
+    # Records shorter than this cannot push a file past maxBytes unnoticed
+    ROLLOVER_MARGIN = 256
+    
+    def _open(self):
+        return self._track_size(super()._open())
+    
+    def _track_size(self, stream):
+        """Seed the size counter from a freshly opened stream."""
+        st = os.fstat(stream.fileno())
+        self._size = st.st_size
+        # See bpo-45401: never roll over anything other than regular files
+        self._regular_file = stat.S_ISREG(st.st_mode)
+        return stream
+    
+    def _encoded_length(self, text: str) -> int:
+        """Number of bytes text occupies once written to the stream."""
+        if text.isascii():
+            return len(text)
+        return len(text.encode(self.stream.encoding, self.stream.errors or "strict"))
+    
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0 or not self._regular_file:
+            return False
+        if self._size + self.ROLLOVER_MARGIN < self.maxBytes:
+            return False
+        msg = self.format(record) + self.terminator
+        return self._size + self._encoded_length(msg) >= self.maxBytes
+    
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                if self.mode == 'w' and self._closed:
+                    return
+                self.stream = self._open()
+            length = self._encoded_length(msg)
+            if (self.maxBytes > 0 and self._regular_file and self._size
+                    and self._size + length >= self.maxBytes):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += length
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BufferedRotatingFileHandler(FastRotatingFileHandler):
+    """
+    Rotating file handler that buffers writes instead of flushing every record.
+    
+    Used behind a QueueListener, which calls flush_buffer() whenever the queue
+    runs empty, so bursts of records reach the file in a few large writes.
+    Setting buffered to False restores a flush after every record, for use
+    without a listener.
+    """
+    
+    def __init__(self, *args, buffer_size: int = FILE_BUFFER_SIZE, **kwargs):
+        self.buffer_size = buffer_size
+        self.buffered = True
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        return self._track_size(open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                                     encoding=self.encoding, errors=self.errors))
+    
+    def flush(self):
+        # Deferred to flush_buffer() while buffered; closing the stream also
+        # flushes it
+        if not self.buffered:
+            super().flush()
+    
+    def flush_buffer(self) -> None:
+        """Flush buffered records to the file."""
+        with self.lock:
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes buffered handlers once the queue is empty."""
+    
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush_buffer()
+
+# Rich console shared by logging and CLI output, created on first use
+_CONSOLE = None
+
+
+def get_console():
+    """
+    Get the process-wide Rich console.
+    
+    Log records, CLI output and progress spinners must share one console so
+    that Rich can render them without garbling each other.
+    
+    Returns:
+        Shared rich.console.Console instance, or None if Rich is not installed
+    """
+    global _CONSOLE
+    if _CONSOLE is None:
+        try:
+            from rich.console import Console
+        except ImportError:
+            return None
+        _CONSOLE = Console()
+    return _CONSOLE
+
+
+class _TaskFileHandler(FastRotatingFileHandler):
+    """Per-task file handler that refuses to reopen once retired."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retired = False
+        self.last_used = time.monotonic()
+    
+    def emit_unless_retired(self, record) -> bool:
+        """
+        Write a record unless the handler has been retired.
+        
+        Returns:
+            False if the handler was retired and the record was not written
+        """
+        with self.lock:
+            if self.retired:
+                return False
+            self.last_used = time.monotonic()
+            self.emit(record)
+        return True
+    
+    def retire(self) -> None:
+        """Close the handler for good."""
+        with self.lock:
+            self.retired = True
+            self.close()
+
+
+class PerTaskFileHandler(logging.Handler):
+    """
+    Handler that writes each task's records to its own rotating log file.
+    
+    Records are routed by key_fn() (the current thread by default). Every task
+    file has its own handler and lock, so concurrent workers do not serialize
+    on a single shared file handler.
+    
+    Task files are opened on their first record and tracked in least recently
+    used order. Once more than max_open are open, the least recently used
+    ones are closed, but only after being idle for idle_timeout seconds, so
+    active tasks never thrash; max_open is a soft limit.
+    """
+    
+    def __init__(self, log_dir: Union[str, Path],
+                 key_fn: Callable[[], Hashable] = threading.get_ident,
+                 max_size: int = 10 * 1024 * 1024,
+                 backup_count: int = 5,
+                 max_open: int = 32,
+                 idle_timeout: float = 60.0):
+        super().__init__()
+        self.log_dir = Path(log_dir)
+        self.key_fn = key_fn
+        self.max_size = max_size
+        self.backup_count = backup_count
+        self.max_open = max_open
+        self.idle_timeout = idle_timeout
+        # Open task handlers, least recently used first
+        self.task_handlers: "OrderedDict[Hashable, _TaskFileHandler]" = OrderedDict()
+    
+    def handle(self, record):
+        # Locking is left to the per-task handlers
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+    
+    def emit(self, record):
+        key = self.key_fn()
+        while True:
+            handler = self.task_handlers.get(key)
+            if handler is None:
+                handler = self._create_task_handler(key)
+            else:
+                try:
+                    self.task_handlers.move_to_end(key)
+                except KeyError:
+                    # Retired by another thread; the retry creates a new one
+                    pass
+            if handler.emit_unless_retired(record):
+                return
+    
+    def _create_task_handler(self, key: Hashable) -> _TaskFileHandler:
+        """Create the file handler for a task, once per key."""
+        with self.lock:
+            handler = self.task_handlers.get(key)
+            if handler is None:
+                self._retire_idle_handlers()
+                # The file itself is opened by the first emit, under the task
+                # handler's own lock
+                handler = _TaskFileHandler(
+                    self.log_dir / f"ionspid-{key}.log",
+                    maxBytes=self.max_size, backupCount=self.backup_count, delay=True
+                )
+                handler.setFormatter(self.formatter or _DETAILED_FMT)
+                self.task_handlers[key] = handler
+        return handler
+    
+    def _retire_idle_handlers(self) -> None:
+        """Close least recently used task handlers idle past idle_timeout."""
+        deadline = time.monotonic() - self.idle_timeout
+        while len(self.task_handlers) >= self.max_open:
+            key, handler = next(iter(self.task_handlers.items()))
+            if handler.last_used > deadline:
+                break
+            del self.task_handlers[key]
+            handler.retire()
+    
+    def close(self):
+        with self.lock:
+            for handler in self.task_handlers.values():
+                handler.retire()
+            self.task_handlers.clear()
+        super().close()
+
 
 class LogManager:
     """
@@ -54,23 +424,50 @@ class LogManager:
         self.root_logger = logging.getLogger("ionspid")
         self.root_logger.setLevel(logging.INFO)
         self.handlers = {}
+        # Background listeners of queued handlers: name -> (listener, handler)
+        self._listeners = {}
+        atexit.register(self._stop_listeners)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(before=self._before_fork,
+                                after_in_parent=self._after_fork_in_parent,
+                                after_in_child=self._after_fork_in_child)
         
         # Set up default console handler
         self._setup_console_handler()
         
     def _setup_console_handler(self):
-        """Set up the default console handler with rich integration."""
-        console = Console()
-        rich_traceback_install(console=console, show_locals=True)
-        console_handler = RichHandler(console=console, show_time=True, show_level=True, show_path=True, rich_tracebacks=True)
-        console_handler.setFormatter(logging.Formatter(DEFAULT_FORMAT))
+        """
+        Set up the default console handler.
+        
+        Rich output is only used on interactive terminals; piped and daemon runs
+        get a plain stream handler on the same stream (stdout). Caller paths are
+        not shown on the console; file logs include them via DETAILED_FORMAT.
+        """
+        interactive = sys.stdout is not None and sys.stdout.isatty()
+        console = get_console() if interactive else None
+        if console is None:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(_DEFAULT_FMT)
+            self.root_logger.addHandler(console_handler)
+            self.handlers["console"] = console_handler
+            return
+        
+        from rich.logging import RichHandler
+        from rich.traceback import install as rich_traceback_install
+        
+        # Capturing locals in every frame is expensive; opt in for debugging
+        show_locals = os.environ.get("IONSPID_RICH_LOCALS") == "1"
+        rich_traceback_install(console=console, show_locals=show_locals)
+        console_handler = RichHandler(console=console, show_time=True, show_level=True, show_path=False, rich_tracebacks=True)
+        console_handler.setFormatter(_DEFAULT_FMT)
         self.root_logger.addHandler(console_handler)
         self.handlers["console"] = console_handler
     
     def setup_file_logging(self, log_dir: Union[str, Path], 
                           log_file: str = "ionspid.log",
                           max_size: int = 10 * 1024 * 1024,  # 10 MB
-                          backup_count: int = 5) -> None:
+                          backup_count: int = 5,
+                          buffer_size: int = FILE_BUFFER_SIZE) -> None:
         """
         Set up file-based logging with rotation.
         
@@ -79,41 +476,170 @@ class LogManager:
             log_file: Name of the log file
             max_size: Maximum size of each log file in bytes
             backup_count: Number of backup files to keep
+            buffer_size: Write buffer size in bytes; larger buffers mean fewer
+                        write() calls for high-volume logging
         """
         log_dir = Path(log_dir)
-        log_dir.mkdir(parents=True, exist_ok=True)
+        if not log_dir.is_dir():
+            log_dir.mkdir(parents=True, exist_ok=True)
         
         log_path = log_dir / log_file
         
-        # Create rotating file handler
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_path, maxBytes=max_size, backupCount=backup_count
+        # Create a buffered rotating file handler, fed from a background
+        # thread so that records are written in batches
+        file_handler = BufferedRotatingFileHandler(
+            log_path, maxBytes=max_size, backupCount=backup_count,
+            buffer_size=buffer_size
         )
-        file_handler.setFormatter(logging.Formatter(DETAILED_FORMAT))
-        self.root_logger.addHandler(file_handler)
-        self.handlers["file"] = file_handler
+        file_handler.setFormatter(_DETAILED_FMT)
+        
+        self._add_queued_handler("file", file_handler, _FlushingQueueListener)
         
     def setup_syslog(self, address='/dev/log', facility=logging.handlers.SysLogHandler.LOG_USER):
-        """Set up syslog handler."""
+        """Set up syslog handler, sending from a background thread."""
         syslog_handler = logging.handlers.SysLogHandler(address=address, facility=facility)
-        syslog_handler.setFormatter(logging.Formatter(DEFAULT_FORMAT))
-        self.root_logger.addHandler(syslog_handler)
-        self.handlers["syslog"] = syslog_handler
+        syslog_handler.setFormatter(_DEFAULT_FMT)
+        self._add_queued_handler("syslog", syslog_handler)
+    
+    def setup_per_task_logging(self, log_dir: Union[str, Path],
+                               key_fn: Callable[[], Hashable] = threading.get_ident,
+                               max_size: int = 10 * 1024 * 1024,
+                               backup_count: int = 5,
+                               max_open: int = 32,
+                               idle_timeout: float = 60.0) -> None:
+        """
+        Set up file logging with a separate rotating file per task.
+        
+        Args:
+            log_dir: Directory to store log files
+            key_fn: Function returning the current task's key, used in the
+                   file name (ionspid-<key>.log); defaults to the thread id
+            max_size: Maximum size of each log file in bytes
+            backup_count: Number of backup files to keep
+            max_open: Number of open task log files above which idle ones
+                     are closed
+            idle_timeout: Seconds a task log file must be unused before it
+                         may be closed
+        """
+        log_dir = Path(log_dir)
+        if not log_dir.is_dir():
+            log_dir.mkdir(parents=True, exist_ok=True)
+        
+        task_handler = PerTaskFileHandler(log_dir, key_fn=key_fn, max_size=max_size,
+                                          backup_count=backup_count, max_open=max_open,
+                                          idle_timeout=idle_timeout)
+        task_handler.setFormatter(_DETAILED_FMT)
+        self._remove_handler("per_task")
+        self.root_logger.addHandler(task_handler)
+        self.handlers["per_task"] = task_handler
+    
+    def _add_queued_handler(self, name: str, handler: logging.Handler,
+                            listener_cls=logging.handlers.QueueListener) -> None:
+        """
+        Attach a handler that runs on a background thread behind a queue.
+        
+        Args:
+            name: Key of the handler in self.handlers
+            handler: Handler that performs the actual I/O
+            listener_cls: QueueListener class that drives the handler
+        """
+        self._remove_handler(name)
+        
+        log_queue = queue.Queue(-1)
+        listener = listener_cls(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        self._listeners[name] = (listener, handler)
+        
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        self.root_logger.addHandler(queue_handler)
+        self.handlers[name] = queue_handler
+    
+    def _remove_handler(self, name: str) -> None:
+        """
+        Detach and close a previously set up handler, if any.
+        
+        Args:
+            name: Key of the handler in self.handlers
+        """
+        existing = self.handlers.pop(name, None)
+        if existing is None:
+            return
+        
+        self.root_logger.removeHandler(existing)
+        queued = self._listeners.pop(name, None)
+        if queued is not None:
+            listener, handler = queued
+            listener.stop()
+            handler.close()
+        existing.close()
+    
+    def _stop_listeners(self) -> None:
+        """Drain all logging queues and close their handlers at exit."""
+        for listener, handler in self._listeners.values():
+            listener.stop()
+            handler.close()
+        self._listeners.clear()
+
+    def _before_fork(self) -> None:
+        """Flush queued handlers and hold their locks while the process forks."""
+        for _, handler in self._listeners.values():
+            handler.acquire()
+            # Buffered data would otherwise be written again by the child
+            stream = getattr(handler, "stream", None)
+            if stream is not None:
+                stream.flush()
+    
+    def _after_fork_in_parent(self) -> None:
+        """Release the handler locks taken by _before_fork()."""
+        for _, handler in self._listeners.values():
+            handler.release()
+    
+    def _after_fork_in_child(self) -> None:
+        """
+        Attach queued handlers directly in a forked child.
+        
+        Listener threads do not survive fork(), so records put on the inherited
+        queues would never be written. The child writes synchronously instead;
+        handler locks have already been reset by the logging module.
+        """
+        for name, (_, handler) in self._listeners.items():
+            queue_handler = self.handlers[name]
+            self.root_logger.removeHandler(queue_handler)
+            handler.setLevel(max(handler.level, queue_handler.level))
+            if isinstance(handler, BufferedRotatingFileHandler):
+                handler.buffered = False
+            self.root_logger.addHandler(handler)
+            self.handlers[name] = handler
+        self._listeners.clear()
 
     def configure_from_yaml(self, config_path: Union[str, Path]):
         """Configure logging from a YAML file."""
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml_config(config_path)
         # Example config: {console_level: 'info', file_level: 'debug', log_dir: 'logs', ...}
         self.set_global_level(config.get('console_level', 'info'))
         if config.get('log_dir'):
             self.setup_file_logging(config['log_dir'])
         if config.get('syslog'):
-            self.setup_syslog(**config['syslog'])
+            sys_cfg = config['syslog']
+            address = sys_cfg.get('address', '/dev/log')
+            if isinstance(address, list):
+                # (host, port) pairs come back from YAML/JSON as lists
+                address = tuple(address)
+            facility = sys_cfg.get('facility', logging.handlers.SysLogHandler.LOG_USER)
+            if not isinstance(facility, int):
+                facility = _FACILITY_MAP.get(str(facility).lower(), logging.handlers.SysLogHandler.LOG_USER)
+            self.setup_syslog(address=address, facility=facility)
         if 'module_levels' in config:
             self.configure_log_levels(config['module_levels'])
 
 
+# Shared LogManager, created by the first get_logger() call
+_LM: Optional[LogManager] = None
+
+# Loggers returned by get_logger(), keyed by the requested name
+_LOGGERS: Dict[str, logging.Logger] = {}
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the specified name.
@@ -127,8 +653,26 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        logger = _LOGGERS[name] = _build_logger(name)
+    return logger
+
+
+def _build_logger(name: str) -> logging.Logger:
+    """
+    Create the logger for a get_logger() name, initializing logging if needed.
+    
+    Args:
+        name: Logger name as passed to get_logger()
+        
+    Returns:
+        Logger under the 'ionspid' hierarchy
+    """
     # Ensure the log manager is initialized
-    LogManager()
+    global _LM
+    if _LM is None:
+        _LM = LogManager()
     
     # If the name doesn't start with 'ionspid', prefix it
     if not name.startswith("ionspid"):
@@ -140,6 +684,22 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+def _level_value(name: str) -> Optional[int]:
+    """
+    Look up the numeric value of a user-friendly level name.
+    
+    Args:
+        name: Level name in any case, e.g. "info" or "INFO"
+        
+    Returns:
+        Numeric log level, or None if the name is unknown
+    """
+    level = _LEVEL_LOOKUP.get(name)
+    if level is None:
+        level = _LEVEL_LOOKUP.get(name.lower())
+    return level
+
+
 def configure_logging(log_dir: Optional[Union[str, Path]] = None,
                      console_level: str = "info",
                      file_level: str = "debug",
@@ -163,18 +723,20 @@ def configure_logging(log_dir: Optional[Union[str, Path]] = None,
         return
     
     # Set console level
-    if console_level.lower() in LOG_LEVELS:
+    level = _level_value(console_level)
+    if level is not None:
         console_handler = log_manager.handlers.get("console")
         if console_handler:
-            console_handler.setLevel(LOG_LEVELS[console_level.lower()])
+            console_handler.setLevel(level)
     
     # Set up file logging if directory is provided
     if log_dir is not None:
         log_manager.setup_file_logging(log_dir)
-        if file_level.lower() in LOG_LEVELS:
+        level = _level_value(file_level)
+        if level is not None:
             file_handler = log_manager.handlers.get("file")
             if file_handler:
-                file_handler.setLevel(LOG_LEVELS[file_level.lower()])
+                file_handler.setLevel(level)
     
     # Configure module-specific levels
     if module_levels: